@@ -1,25 +1,41 @@
 from typing import TYPE_CHECKING
 
 
+# NOTE: Attributes are cached in the instance once resolved, so that `__getattr__` is
+# not called again (e.g. `stats.norm` in a callback of a slider).
 class LazyScipyStats:
     def __getattr__(self, key: str):
         from scipy import stats
 
-        return getattr(stats, key)
+        attr = getattr(stats, key)
+        setattr(self, key, attr)
+        return attr
+
+
+class LazyScipySpecial:
+    def __getattr__(self, key: str):
+        from scipy import special
+
+        attr = getattr(special, key)
+        setattr(self, key, attr)
+        return attr
 
 
 class LazyScikitPosthocs:
     def __getattr__(self, key: str):
         import scikit_posthocs
 
-        return getattr(scikit_posthocs, key)
+        attr = getattr(scikit_posthocs, key)
+        setattr(self, key, attr)
+        return attr
 
 
 if TYPE_CHECKING:
-    from scipy import stats
+    from scipy import stats, special
     import scikit_posthocs
 else:
     stats = LazyScipyStats()
+    special = LazyScipySpecial()
     scikit_posthocs = LazyScikitPosthocs()
 
-__all__ = ["stats", "scikit_posthocs"]
+__all__ = ["stats", "special", "scikit_posthocs"]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, TYPE_CHECKING
+import numpy as np
+from himena_stats._lazy_import import stats, special
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# NOTE: Calling `rv_frozen.pdf` or `rv_frozen.pmf` validates and broadcasts the
+# parameters every time, which is much slower than evaluating the function itself on
+# small arrays. Functions here are closed-form evaluations for the built-in
+# distributions, called with the keyword arguments of the frozen distribution.
+
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
+
+def norm_pdf(x: NDArray[np.float64], loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    z = (x - loc) / scale
+    return np.exp(-0.5 * z * z) / (_SQRT_2PI * scale)
+
+
+def uniform_pdf(x: NDArray[np.float64], loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    inside = (loc <= x) & (x <= loc + scale)
+    return np.where(inside, 1 / scale, 0.0)
+
+
+def expon_pdf(x: NDArray[np.float64], loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    z = (x - loc) / scale
+    return np.where(z >= 0, np.exp(-np.maximum(z, 0.0)) / scale, 0.0)
+
+
+def cauchy_pdf(x: NDArray[np.float64], loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    z = (x - loc) / scale
+    return 1 / (math.pi * scale * (1 + z * z))
+
+
+def gamma_pdf(x: NDArray[np.float64], a, loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    if not a > 0:
+        return np.full(x.shape, np.nan)
+    z = (x - loc) / scale
+    inside = z >= 0
+    z = np.where(inside, z, 0.0)
+    logp = special.xlogy(a - 1, z) - z - special.gammaln(a)
+    return np.where(inside, np.exp(logp) / scale, 0.0)
+
+
+def chi2_pdf(x: NDArray[np.float64], df, loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    return gamma_pdf(x, df / 2, loc, 2 * scale)
+
+
+def beta_pdf(x: NDArray[np.float64], a, b, loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    if not (a > 0 and b > 0):
+        return np.full(x.shape, np.nan)
+    z = (x - loc) / scale
+    inside = (0 <= z) & (z <= 1)
+    z = np.where(inside, z, 0.5)
+    logp = special.xlogy(a - 1, z) + special.xlog1py(b - 1, -z) - special.betaln(a, b)
+    return np.where(inside, np.exp(logp) / scale, 0.0)
+
+
+def t_pdf(x: NDArray[np.float64], df, loc=0.0, scale=1.0) -> NDArray[np.float64]:
+    if not df > 0:
+        return np.full(x.shape, np.nan)
+    if np.isinf(df):
+        return norm_pdf(x, loc, scale)
+    z = (x - loc) / scale
+    logc = special.gammaln((df + 1) / 2) - special.gammaln(df / 2)
+    c = math.exp(logc) / math.sqrt(df * math.pi)
+    return c * (1 + z * z / df) ** (-(df + 1) / 2) / scale
+
+
+def binom_pmf(x: NDArray[np.number], n, p, loc=0) -> NDArray[np.float64]:
+    if not (n >= 0 and float(n).is_integer() and 0 <= p <= 1):
+        return np.full(x.shape, np.nan)
+    k = x - loc
+    inside = (0 <= k) & (k <= n)
+    k = np.where(inside, k, 0)
+    logp = (
+        special.gammaln(n + 1)
+        - special.gammaln(k + 1)
+        - special.gammaln(n - k + 1)
+        + special.xlogy(k, p)
+        + special.xlog1py(n - k, -p)
+    )
+    return np.where(inside, np.exp(logp), 0.0)
+
+
+def poisson_pmf(x: NDArray[np.number], mu, loc=0) -> NDArray[np.float64]:
+    if not mu >= 0:
+        return np.full(x.shape, np.nan)
+    k = x - loc
+    inside = k >= 0
+    k = np.where(inside, k, 0)
+    logp = special.xlogy(k, mu) - mu - special.gammaln(k + 1)
+    return np.where(inside, np.exp(logp), 0.0)
+
+
+_FAST_PDF: dict[str, Callable[..., NDArray[np.float64]]] = {
+    "norm": norm_pdf,
+    "uniform": uniform_pdf,
+    "expon": expon_pdf,
+    "cauchy": cauchy_pdf,
+    "gamma": gamma_pdf,
+    "chi2": chi2_pdf,
+    "beta": beta_pdf,
+    "t": t_pdf,
+}
+
+_FAST_PMF: dict[str, Callable[..., NDArray[np.float64]]] = {
+    "binom": binom_pmf,
+    "poisson": poisson_pmf,
+}
+
+
+def is_builtin(dist: stats.rv_frozen) -> bool:
+    """True if the distribution is one of the scipy.stats built-in distributions."""
+    name = dist.dist.name
+    return isinstance(name, str) and type(getattr(stats, name, None)) is type(dist.dist)
+
+
+def _fast_func(dist: stats.rv_frozen, table: dict[str, Callable]) -> Callable | None:
+    func = table.get(dist.dist.name)
+    if func is None or dist.args or not is_builtin(dist):
+        return None
+    if not dist.kwds.get("scale", 1.0) > 0:
+        return None
+    return func
+
+
+def pdf(dist: stats.rv_frozen, x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Evaluate the PDF, bypassing scipy if possible."""
+    if func := _fast_func(dist, _FAST_PDF):
+        return func(x, **dist.kwds)
+    return dist.pdf(x)
+
+
+def pmf(dist: stats.rv_frozen, x: NDArray[np.number]) -> NDArray[np.float64]:
+    """Evaluate the PMF, bypassing scipy if possible."""
+    if func := _fast_func(dist, _FAST_PMF):
+        return func(x, **dist.kwds)
+    return dist.pmf(x)
@@ -1,32 +1,45 @@
 from __future__ import annotations
 
+from typing import Callable
 import numpy as np
 from himena_stats._lazy_import import stats
 
 
+# NOTE: MLE of some distributions can be calculated in closed forms. They are much
+# faster than `rv_continuous.fit`, which runs a numerical optimizer.
+
+
 def fit_norm(obs: np.ndarray) -> stats.rv_frozen:
-    loc, scale = stats.norm.fit(obs)
-    return stats.norm(loc=loc, scale=scale)
+    return stats.norm(loc=obs.mean(), scale=obs.std())
 
 
 def fit_gamma(obs: np.ndarray) -> stats.rv_frozen:
-    a, loc, scale = stats.gamma.fit(obs)
+    if obs.min() > 0:
+        # fixing loc=0 reduces the problem to a root finding of the shape parameter
+        a, loc, scale = stats.gamma.fit(obs, floc=0)
+    else:  # outside the support of loc=0
+        a, loc, scale = stats.gamma.fit(obs)
     return stats.gamma(a=a, scale=scale)
 
 
 def fit_expon(obs: np.ndarray) -> stats.rv_frozen:
-    loc, scale = stats.expon.fit(obs)
+    if obs.min() >= 0:
+        return stats.expon(scale=obs.mean())
+    loc, scale = stats.expon.fit(obs)  # outside the support of loc=0
     return stats.expon(scale=scale)
 
 
 def fit_uniform(obs: np.ndarray) -> stats.rv_frozen:
     # NOTE: scipy.stats uses [loc, loc + scale] to specify a uniform distribution.
-    loc, scale = stats.uniform.fit(obs)
-    return stats.uniform(loc=loc, scale=scale)
+    loc = obs.min()
+    return stats.uniform(loc=loc, scale=obs.max() - loc)
 
 
 def fit_beta(obs: np.ndarray) -> stats.rv_frozen:
-    a, b, loc, scale = stats.beta.fit(obs)
+    if obs.min() > 0 and obs.max() < 1:
+        a, b, loc, scale = stats.beta.fit(obs, floc=0, fscale=1)
+    else:  # outside the support of loc=0, scale=1
+        a, b, loc, scale = stats.beta.fit(obs)
     return stats.beta(a=a, b=b)
 
 
@@ -58,26 +71,22 @@ def fit_poisson(obs: np.ndarray) -> stats.rv_frozen:
     return stats.poisson(mu=mu)
 
 
+_FIT_FUNCS: dict[str, Callable[[np.ndarray], stats.rv_frozen]] = {
+    "norm": fit_norm,
+    "gamma": fit_gamma,
+    "expon": fit_expon,
+    "uniform": fit_uniform,
+    "beta": fit_beta,
+    "cauchy": fit_cauchy,
+    "t": fit_t,
+    "chi2": fit_chi2,
+    "binom": fit_binom,
+    "poisson": fit_poisson,
+}
+
+
 def fit_dist(obs, dist: stats.rv_frozen) -> stats.rv_frozen:
     dist_name: str = dist.dist.name
-    if dist_name == "norm":
-        return fit_norm(obs)
-    elif dist_name == "gamma":
-        return fit_gamma(obs)
-    elif dist_name == "expon":
-        return fit_expon(obs)
-    elif dist_name == "uniform":
-        return fit_uniform(obs)
-    elif dist_name == "beta":
-        return fit_beta(obs)
-    elif dist_name == "cauchy":
-        return fit_cauchy(obs)
-    elif dist_name == "t":
-        return fit_t(obs)
-    elif dist_name == "chi2":
-        return fit_chi2(obs)
-    elif dist_name == "binom":
-        return fit_binom(obs)
-    elif dist_name == "poisson":
-        return fit_poisson(obs)
-    raise NotImplementedError
+    if (fit_func := _FIT_FUNCS.get(dist_name)) is None:
+        raise NotImplementedError(f"Fitting {dist_name!r} is not supported.")
+    return fit_func(obs)
@@ -10,7 +10,13 @@ from himena.standards import plotting as hplt
 from himena.standards.model_meta import TableMeta
 from himena_stats._lazy_import import stats
 from himena_stats.consts import MENUS_DIST
-from himena_stats.distributions._utils import draw_pdf_or_pmf, infer_edges
+from himena_stats.distributions._utils import (
+    count_integers,
+    draw_pdf_or_pmf,
+    draw_samples,
+    infer_edges,
+    is_continuous,
+)
 from himena_stats.distributions._fit import fit_dist
 
 OBS_TYPES = [StandardType.TABLE, StandardType.ARRAY, StandardType.DATAFRAME]
@@ -44,7 +50,7 @@ def fit_mle(model: WidgetDataModel) -> Parametric:
             initial guess. Otherwise, only the distribution model will be considered.
         """
         dist: "stats.rv_frozen" = model.value
-        dtype = np.float64 if hasattr(dist, "pdf") else np.int64
+        dtype = np.float64 if is_continuous(dist) else np.int64
         arr = _norm_obs(obs, obs_range, np.dtype(dtype))
         dist_fitted = fit_dist(arr, dist)
         return WidgetDataModel(
@@ -82,25 +88,28 @@ def plot_dist(win: SubWindow) -> Parametric:
         model = win.to_model()
         dist: "stats.rv_frozen" = model.value
         xlow, xhigh = infer_edges(dist)
-        is_continuous = hasattr(dist, "pdf")
+        continuous = is_continuous(dist)
         fig = hplt.figure()
         if obs is not None:
-            dtype = np.float64 if is_continuous else np.int64
+            dtype = np.float64 if continuous else np.int64
             arr = _norm_obs(obs, obs_range, np.dtype(dtype))
-            if is_continuous:
+            amin, amax = arr.min(), arr.max()
+            if continuous:
+                # passing the range avoids another min/max pass in np.histogram
                 fig.hist(
                     arr,
                     bins=min(int(np.sqrt(arr.size)), 64),
+                    range=(amin, amax),
                     stat="density",
                     color="skyblue",
                     name="observations",
                 )
             else:
-                values, counts = np.unique_counts(arr)
+                values, counts = count_integers(arr)
                 density = counts / arr.size
                 fig.bar(values, density, color="skyblue", name="observations")
-            xlow = min(xlow, arr.min())
-            xhigh = max(xhigh, arr.max())
+            xlow = min(xlow, amin)
+            xhigh = max(xhigh, amax)
 
         x, y = draw_pdf_or_pmf(dist, xlow, xhigh)
         fig.plot(x, y, width=2.5, color="red", name="model")
@@ -121,7 +130,7 @@ def plot_dist(win: SubWindow) -> Parametric:
 )
 def sample_dist(win: SubWindow) -> Parametric:
     """Random sampling from a distribution."""
-    random_state_default = np.random.randint(0, 10000)
+    random_state_default = int(np.random.default_rng().integers(0, 10000))
 
     @configure_gui(random_state={"value": random_state_default})
     def run_sample(sample_size: list[int] = (100,), random_state: int | None = None):
@@ -134,7 +143,7 @@ def sample_dist(win: SubWindow) -> Parametric:
         """
         model = win.to_model()
         dist: "stats.rv_frozen" = model.value
-        samples = dist.rvs(size=sample_size, random_state=random_state)
+        samples = draw_samples(dist, sample_size, random_state)
         return WidgetDataModel(
             value=samples,
             type=StandardType.ARRAY,
@@ -225,15 +234,16 @@ def _norm_obs(obs: WidgetDataModel, obs_range, dtype: np.dtype[_D]) -> NDArray[_
         rinds, cinds = obs_range
         obs_slice = slice(*rinds), slice(*cinds)
     if obs.is_subtype_of(StandardType.TABLE):
-        arr = obs.value[obs_slice].astype(dtype)
+        arr = obs.value[obs_slice].astype(dtype, copy=False)
     elif obs.is_subtype_of(StandardType.DATAFRAME):
         rsl, csl = obs_slice
         if csl.start - csl.stop != 1:
             raise ValueError("Only single-column selection is allowed")
         df = wrap_dataframe(obs.value)
-        arr = df[rsl, csl.start].astype(dtype)
+        arr = df[rsl, csl.start].astype(dtype, copy=False)
     elif obs.is_subtype_of(StandardType.ARRAY):
-        arr = obs.value[obs_slice].astype(dtype)
+        # a view is returned if possible (the array is not modified in-place)
+        arr = np.asarray(obs.value[obs_slice], dtype=dtype)
     else:
         raise NotImplementedError
     return arr
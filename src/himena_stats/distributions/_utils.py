@@ -1,28 +1,40 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 import numpy as np
+from himena_stats._lazy_import import stats
+from himena_stats.distributions import _fast_pdf
 
 if TYPE_CHECKING:
-    from scipy import stats
     from numpy.typing import NDArray
 
 
+def is_continuous(dist: stats.rv_frozen) -> bool:
+    """True if the distribution is continuous, False if discrete."""
+    return isinstance(dist.dist, stats.rv_continuous)
+
+
 def draw_pdf_or_pmf(
     dist: stats.rv_frozen,
     xlow: float,
     xhigh: float,
+    num: int = 100,
 ) -> tuple[NDArray[np.number], NDArray[np.number]]:
-    if hasattr(dist, "pdf"):  # contiuous
-        x0 = np.linspace(xlow, xhigh, 100)
-        y0: np.ndarray = dist.pdf(x0)
-        x = np.concatenate([[x0[0]], x0, [x0[-1]]])
-        y = np.concatenate([[0.0], y0, [0.0]])
-    elif hasattr(dist, "pmf"):  # discrete
+    if is_continuous(dist):
+        # pad both edges with y=0 to close the polygon
+        x = np.empty(num + 2)
+        x[1:-1] = np.linspace(xlow, xhigh, num)
+        x[0], x[-1] = x[1], x[-2]
+        y = np.zeros(num + 2)
+        y[1:-1] = _fast_pdf.pdf(dist, x[1:-1])
+    elif isinstance(dist.dist, stats.rv_discrete):
         x0 = np.arange(int(xlow), int(xhigh) + 1)
-        y0: np.ndarray = dist.pmf(x0)
+        y0: np.ndarray = _fast_pdf.pmf(dist, x0)
+        # write bar edges directly into the strided views without temporary arrays
         x = np.empty(4 * len(x0))
-        x[0::4] = x[1::4] = x0 - 0.1
-        x[2::4] = x[3::4] = x0 + 0.1
+        np.subtract(x0, 0.1, out=x[0::4])
+        np.add(x0, 0.1, out=x[2::4])
+        x[1::4] = x[0::4]
+        x[3::4] = x[2::4]
         y = np.zeros(4 * len(x0))
         y[1::4] = y0
         y[2::4] = y0
@@ -32,12 +44,83 @@ def draw_pdf_or_pmf(
 
 
 def infer_edges(dist: stats.rv_frozen) -> tuple[float, float]:
-    if np.isfinite(dist.a):
-        xlow = dist.a
-    else:
-        xlow = dist.ppf(0.001)
-    if np.isfinite(dist.b):
-        xhigh = dist.b
-    else:
-        xhigh = dist.ppf(0.999)
+    xlow, xhigh = dist.support()
+    if np.isnan(xlow) or np.isnan(xhigh):  # invalid parameters
+        xlow, xhigh = dist.a, dist.b
+    if not (np.isfinite(xlow) and np.isfinite(xhigh)):
+        # ppf is slow for many distributions. Evaluate both edges in one call.
+        qlow, qhigh = dist.ppf([0.001, 0.999])
+        if not np.isfinite(xlow):
+            xlow = qlow
+        if not np.isfinite(xhigh):
+            xhigh = qhigh
     return xlow, xhigh
+
+
+def dist_key(dist: stats.rv_frozen) -> tuple | None:
+    """Return a hashable key that identifies the distribution, if available."""
+    if dist.args or not _fast_pdf.is_builtin(dist):
+        return None
+    key = dist.dist.name, tuple(sorted(dist.kwds.items()))
+    try:
+        hash(key)
+    except TypeError:  # such as ndarray parameters
+        return None
+    return key
+
+
+def draw_samples(
+    dist: stats.rv_frozen,
+    size: int | tuple[int, ...],
+    random_state: int | None = None,
+) -> NDArray[np.number]:
+    """Draw random samples, directly from a numpy Generator if possible."""
+    rng = np.random.default_rng(random_state)
+    if dist_key(dist) is None or not (scale := dist.kwds.get("scale", 1.0)) > 0:
+        return dist.rvs(size=size, random_state=rng)
+    kw = dist.kwds
+    name = dist.dist.name
+    loc = kw.get("loc", 0)
+    if name == "norm":
+        out = rng.standard_normal(size)
+    elif name == "uniform":
+        out = rng.random(size)
+    elif name == "expon":
+        out = rng.standard_exponential(size)
+    elif name == "cauchy":
+        out = rng.standard_cauchy(size)
+    elif name == "t" and kw.get("df", np.nan) > 0:
+        if np.isinf(kw["df"]):  # standard_t returns NaN for df=inf
+            out = rng.standard_normal(size)
+        else:
+            out = rng.standard_t(kw["df"], size)
+    elif name == "gamma" and kw.get("a", np.nan) > 0:
+        out = rng.standard_gamma(kw["a"], size)
+    elif name == "beta" and kw.get("a", np.nan) > 0 and kw.get("b", np.nan) > 0:
+        out = rng.beta(kw["a"], kw["b"], size)
+    elif name == "poisson" and kw.get("mu", np.nan) >= 0:
+        return rng.poisson(kw["mu"], size) + loc
+    elif (
+        name == "binom"
+        and float(n := kw.get("n", np.nan)).is_integer()
+        and n >= 0
+        and 0 <= kw.get("p", np.nan) <= 1
+    ):
+        return rng.binomial(n, kw["p"], size) + loc
+    else:
+        return dist.rvs(size=size, random_state=rng)
+    return loc + scale * out
+
+
+def count_integers(arr: NDArray[np.integer]) -> tuple[NDArray[np.integer], NDArray]:
+    """Count unique values of an integer array (same as `np.unique_counts`).
+
+    If values are in a moderate range, this is calculated by `np.bincount` in O(N)
+    instead of sorting the array.
+    """
+    vmin, vmax = arr.min(), arr.max()
+    if vmax - vmin > 1_000_000:
+        return np.unique_counts(arr)
+    counts = np.bincount(arr - vmin)
+    values = np.flatnonzero(counts)
+    return values + vmin, counts[values]
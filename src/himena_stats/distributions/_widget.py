@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
+import numpy as np
+import qtpy
 from qtpy import QtWidgets as QtW, QtCore, QtGui
 from himena import WidgetDataModel, StandardType
 from himena.plugins import validate_protocol
-from himena_stats.distributions._utils import draw_pdf_or_pmf, infer_edges
+from himena_stats.distributions._utils import (
+    draw_pdf_or_pmf,
+    infer_edges,
+    dist_key,
+    is_continuous,
+)
 
 if TYPE_CHECKING:
     from scipy import stats
@@ -13,6 +21,9 @@ if TYPE_CHECKING:
 class QDistGraphics(QtW.QGraphicsView):
     """Graphics view for displaying a distribution."""
 
+    _GRID_CACHE_SIZE = 32
+    _REDRAW_DELAY_MSEC = 50
+
     def __init__(self):
         scene = QtW.QGraphicsScene()
         super().__init__(scene)
@@ -20,32 +31,101 @@ class QDistGraphics(QtW.QGraphicsView):
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._color = QtGui.QColor(128, 128, 128)
         self.setTransform(QtGui.QTransform().scale(1, -1))  # upside down
+        self._grid_cache: OrderedDict[tuple, tuple[np.ndarray, np.ndarray]] = (
+            OrderedDict()
+        )
+        self._dist: stats.rv_frozen | None = None
+        self._edges: tuple[float, float] | None = None
+        self._num = 100
+        # redraw after resizing is settled, not on every pixel while dragging
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self._REDRAW_DELAY_MSEC)
+        self._redraw_timer.timeout.connect(self._redraw)
 
     def set_dist(self, dist: stats.rv_frozen):
+        self._redraw_timer.stop()
+        self._dist = dist
+        self._edges = None
+        self._draw(dist, self._grid_num())
+
+    def _draw(self, dist: stats.rv_frozen, num: int):
         scene = self.scene()
         scene.clear()
-        xlow, xhigh = infer_edges(dist)
-        x, y = draw_pdf_or_pmf(dist, xlow, xhigh)
-        polygon = QtGui.QPolygonF([QtCore.QPointF(x[i], y[i]) for i in range(len(x))])
+        x, y = self._get_grid(dist, num)
+        polygon = _to_qpolygonf(x, y)
         scene.addPolygon(polygon, QtGui.QPen(self._color, 0), QtGui.QBrush(self._color))
+        self._num = num
         self.fit_item()
 
+    def _grid_num(self) -> int:
+        """Number of points of continuous distributions for the current width."""
+        if not self.isVisible():  # not laid out yet
+            return 100
+        return int(np.clip(self.viewport().width(), 32, 512))
+
+    def _get_grid(
+        self, dist: stats.rv_frozen, num: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if (key := dist_key(dist)) is not None:
+            # number of points does not affect discrete distributions
+            key = (key, num if is_continuous(dist) else None)
+            if (grid := self._grid_cache.get(key)) is not None:
+                self._grid_cache.move_to_end(key)
+                return grid
+        if self._edges is None:  # edges do not depend on the number of points
+            self._edges = infer_edges(dist)
+        xlow, xhigh = self._edges
+        grid = draw_pdf_or_pmf(dist, xlow, xhigh, num)
+        if key is not None:
+            self._grid_cache[key] = grid
+            if len(self._grid_cache) > self._GRID_CACHE_SIZE:
+                self._grid_cache.popitem(last=False)
+        return grid
+
     def resizeEvent(self, event):
-        self.fit_item()
         super().resizeEvent(event)
+        self.fit_item()
+        if self._dist is not None and is_continuous(self._dist):
+            self._redraw_timer.start()
+
+    def _redraw(self):
+        if self._dist is not None and (num := self._grid_num()) != self._num:
+            self._draw(self._dist, num)
 
     def fit_item(self):
         self.fitInView(self.scene().itemsBoundingRect())
 
 
+def _to_qpolygonf(x: np.ndarray, y: np.ndarray) -> QtGui.QPolygonF:
+    """Create a QPolygonF from x and y coordinates."""
+    size = len(x)
+    if not (qtpy.PYQT5 or qtpy.PYQT6) or size == 0:
+        return QtGui.QPolygonF(list(map(QtCore.QPointF, x.tolist(), y.tolist())))
+    # PyQt exposes the buffer of QPolygonF, which is an array of (qreal, qreal).
+    polygon = QtGui.QPolygonF()
+    polygon.fill(QtCore.QPointF(), size)
+    buf = polygon.data()
+    buf.setsize(2 * size * np.dtype(np.float64).itemsize)
+    xy = np.frombuffer(buf, dtype=np.float64).reshape(size, 2)
+    xy[:, 0] = x
+    xy[:, 1] = y
+    return polygon
+
+
 class QDistParameters(QtW.QPlainTextEdit):
     def __init__(self):
         super().__init__()
         self.setWordWrapMode(QtGui.QTextOption.WrapMode.NoWrap)
         self.setReadOnly(True)
+        self._last_key: tuple | None = None
 
     def set_dist(self, dist: stats.rv_frozen):
         dist_name = dist.dist.name
+        key = (dist_name, tuple(dist.kwds.items()))
+        if key == self._last_key:
+            return
+        self._last_key = key
         params = [f"{k} = {v}" for k, v in dist.kwds.items()]
         newline = "\n".join(params)
         self.setPlainText(f"{dist_name}\n\n{newline}")
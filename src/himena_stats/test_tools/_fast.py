@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import Literal, NamedTuple
+import numpy as np
+from himena_stats._lazy_import import stats, special, scikit_posthocs
+
+# NOTE: `scipy.stats.ttest_ind` and `ttest_rel` go through argument validation, NaN
+# policy handling and axis broadcasting on every call. The input arrays here are
+# always 1D and NaN-free (`dropna` is already applied), so the statistics can be
+# calculated directly. The Student t tail is evaluated with `special.stdtr`.
+
+_Alternative = Literal["two-sided", "less", "greater"]
+
+
+class TtestResult(NamedTuple):
+    statistic: float
+    pvalue: float
+    df: float
+
+
+class MannwhitneyuResult(NamedTuple):
+    statistic: float
+    pvalue: float
+
+
+def ttest_ind(
+    x: np.ndarray,
+    y: np.ndarray,
+    equal_var: bool = True,
+    alternative: _Alternative = "two-sided",
+) -> TtestResult:
+    """Same as `scipy.stats.ttest_ind` for 1D arrays without NaN."""
+    nx, ny = x.size, y.size
+    if nx < 2 or ny < 2:
+        return stats.ttest_ind(x, y, equal_var=equal_var, alternative=alternative)
+    vx = np.var(x, ddof=1) / nx
+    vy = np.var(y, ddof=1) / ny
+    if equal_var:
+        df = nx + ny - 2
+        pooled = ((nx - 1) * vx * nx + (ny - 1) * vy * ny) / df
+        denom = np.sqrt(pooled * (1 / nx + 1 / ny))
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df = (vx + vy) ** 2 / (vx**2 / (nx - 1) + vy**2 / (ny - 1))
+        if np.isnan(df):  # both variances are zero, same as scipy
+            df = 1.0
+        denom = np.sqrt(vx + vy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (np.mean(x) - np.mean(y)) / denom
+    return TtestResult(float(t), _t_pvalue(t, df, alternative), float(df))
+
+
+def ttest_rel(
+    x: np.ndarray,
+    y: np.ndarray,
+    alternative: _Alternative = "two-sided",
+) -> TtestResult:
+    """Same as `scipy.stats.ttest_rel` for 1D arrays without NaN."""
+    n = x.size
+    if n < 2 or n != y.size:
+        return stats.ttest_rel(x, y, alternative=alternative)
+    d = x - y
+    df = n - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.mean(d) / np.sqrt(np.var(d, ddof=1) / n)
+    return TtestResult(float(t), _t_pvalue(t, df, alternative), float(df))
+
+
+def rankdata(a: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Average ranks of a 1D array and the size of each group of tied values."""
+    order = np.argsort(a, kind="stable")
+    sorted_a = a[order]
+    is_new = np.empty(a.size, dtype=np.bool_)
+    is_new[:1] = True
+    np.not_equal(sorted_a[1:], sorted_a[:-1], out=is_new[1:])
+    starts = np.flatnonzero(is_new)
+    counts = np.diff(starts, append=a.size)
+    ranks = np.empty(a.size)
+    ranks[order] = np.repeat(starts + (counts + 1) / 2, counts)
+    return ranks, counts
+
+
+def mannwhitneyu(
+    x: np.ndarray,
+    y: np.ndarray,
+    alternative: _Alternative = "two-sided",
+) -> MannwhitneyuResult:
+    """Same as `scipy.stats.mannwhitneyu` for 1D arrays without NaN."""
+    n1, n2 = x.size, y.size
+    if n1 == 0 or n2 == 0:
+        return stats.mannwhitneyu(x, y, alternative=alternative)
+    ranks, ties = rankdata(np.concatenate([x, y]))
+    if (n1 <= 8 or n2 <= 8) and ties.max() == 1:
+        # scipy uses the exact distribution in this case
+        return stats.mannwhitneyu(x, y, alternative=alternative)
+    u1 = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    u2 = n1 * n2 - u1
+    if alternative == "two-sided":
+        u, factor = max(u1, u2), 2
+    elif alternative == "less":
+        u, factor = u2, 1
+    elif alternative == "greater":
+        u, factor = u1, 1
+    else:
+        raise ValueError(f"Invalid alternative: {alternative!r}")
+    # normal approximation with tie and continuity correction
+    n = n1 + n2
+    tie_term = np.sum(ties.astype(np.float64) ** 3 - ties)
+    s = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (u - n1 * n2 / 2 - 0.5) / s
+    pvalue = min(float(special.ndtr(-z)) * factor, 1.0)
+    return MannwhitneyuResult(float(u1), pvalue)
+
+
+def _t_pvalue(t: float, df: float, alternative: _Alternative) -> float:
+    if alternative == "two-sided":
+        return float(min(2 * special.stdtr(df, -abs(t)), 1.0))
+    elif alternative == "less":
+        return float(special.stdtr(df, t))
+    elif alternative == "greater":
+        return float(special.stdtr(df, -t))
+    raise ValueError(f"Invalid alternative: {alternative!r}")
+
+
+def tukey_hsd(*samples: np.ndarray) -> np.ndarray:
+    """Same as `scipy.stats.tukey_hsd(*samples).pvalue` for 1D arrays without NaN."""
+    if len(samples) < 2 or any(s.size < 2 for s in samples):
+        return stats.tukey_hsd(*samples).pvalue
+    ngroups = len(samples)
+    n = np.array([s.size for s in samples], dtype=np.float64)
+    mean = np.array([np.mean(s) for s in samples])
+    var = np.array([np.var(s, ddof=1) for s in samples])
+    df = n.sum() - ngroups
+    mse = np.sum((n - 1) * var) / df
+    # p-value matrix is symmetric, evaluate the costly distribution on one triangle
+    i, j = np.triu_indices(ngroups, k=1)
+    stand_err = np.sqrt(mse / 2 * (1 / n[i] + 1 / n[j]))
+    q = np.abs(mean[i] - mean[j]) / stand_err
+    pvalues = np.ones((ngroups, ngroups))
+    pvalues[i, j] = pvalues[j, i] = stats.studentized_range.sf(q, ngroups, df)
+    return pvalues
+
+
+# Steel-Dwass pair statistics are calculated from the matrix of counts of each unique
+# value in each group, to avoid ranking every pair of groups separately. The count
+# matrix has (number of groups) x (number of unique values) elements and a few arrays
+# of the same size are alive at the same time, so inputs with more than 32 MB per
+# matrix fall back to scikit-posthocs, which only uses O(N) memory.
+_DSCF_MAX_COUNTS = 1 << 22
+
+
+def posthoc_dscf(samples: list[np.ndarray]) -> np.ndarray:
+    """Same as `scikit_posthocs.posthoc_dscf(samples)` for 1D arrays without NaN."""
+    ngroups = len(samples)
+    if ngroups < 2 or any(s.size == 0 for s in samples):
+        return scikit_posthocs.posthoc_dscf(samples).to_numpy()
+    sizes = np.array([s.size for s in samples])
+    uniq, codes = np.unique(np.concatenate(samples), return_inverse=True)
+    if ngroups * uniq.size > _DSCF_MAX_COUNTS:
+        return scikit_posthocs.posthoc_dscf(samples).to_numpy()
+    group_ids = np.repeat(np.arange(ngroups), sizes)
+    counts = np.bincount(
+        group_ids * uniq.size + codes, minlength=ngroups * uniq.size
+    ).reshape(ngroups, uniq.size)
+    counts = counts.astype(np.float64)
+    cumcounts = np.cumsum(counts, axis=1)
+    # For the pair (i, j), the average rank of the m-th unique value is
+    # P_i[m] + P_j[m] - (C_i[m] + C_j[m] - 1) / 2, where C is the count matrix and P is
+    # its cumulative sum. Summing over the group i is expanded into matrix products.
+    cp = counts @ cumcounts.T
+    cc = counts @ counts.T
+    self_term = np.diag(cp) - (np.diag(cc) - sizes) / 2
+    rank_sums = (
+        self_term[:, None] + cp - cc / 2
+    )  # [i, j] is the rank sum of i in (i, j)
+    # sum of t^3 for t = C_i + C_j is expanded similarly
+    cubes = np.sum(counts**3, axis=1)
+    c2c = (counts**2) @ counts.T
+    i, j = np.triu_indices(ngroups, k=1)
+    ni = sizes[i].astype(np.float64)
+    nj = sizes[j].astype(np.float64)
+    s = ni + nj
+    ri = rank_sums[i, j]
+    rj = s * (s + 1) / 2 - ri
+    u_min = np.minimum(
+        ni * nj + nj * (nj + 1) / 2 - rj, ni * nj + ni * (ni + 1) / 2 - ri
+    )
+    ties = (cubes[i] + cubes[j] + 3 * c2c[i, j] + 3 * c2c[j, i] - s) / 12
+    var = (ni * nj / (s * (s - 1))) * ((s**3 - s) / 12 - ties)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.sqrt(2.0) * (u_min - ni * nj / 2) / np.sqrt(var)
+    pvalues = np.ones((ngroups, ngroups))
+    pvalues[i, j] = pvalues[j, i] = stats.studentized_range.sf(
+        np.abs(z), ngroups, np.inf
+    )
+    return pvalues
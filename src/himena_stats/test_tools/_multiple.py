@@ -11,8 +11,10 @@ from himena.qt.magicgui import SelectionEdit
 
 from himena_stats._lazy_import import stats, scikit_posthocs
 from himena_stats.consts import MENUS_TEST, TABLE_LIKE
+from himena_stats.test_tools import _fast
 from himena_stats.test_tools._utils import (
-    pvalue_to_asterisks,
+    cached_call,
+    pvalue_to_asterisks_array,
     values_groups_to_arrays,
     dropna,
 )
@@ -40,8 +42,7 @@ def steel_dwass_test(win: SubWindow) -> Parametric:
     def run_steel_dwass_test(values: list, groups):
         model = win.to_model()
         arrs = values_groups_to_arrays(model, values, groups)
-        result = scikit_posthocs.posthoc_dscf([dropna(a) for a in arrs])
-        pvalues = result.to_numpy()
+        pvalues = cached_call(_fast.posthoc_dscf, [dropna(a) for a in arrs])
         return WidgetDataModel(
             value=_pval_matrix(pvalues, columns=[a.name for a in arrs]),
             type=StandardType.TABLE,
@@ -73,9 +74,9 @@ def tukey_hsd_test(win: SubWindow) -> Parametric:
     def run_tukey_hsd_test(values: list, groups):
         model = win.to_model()
         arrs = values_groups_to_arrays(model, values, groups)
-        result = stats.tukey_hsd(*[dropna(a) for a in arrs])
+        pvalues = cached_call(_fast.tukey_hsd, *[dropna(a) for a in arrs])
         return WidgetDataModel(
-            value=_pval_matrix(result.pvalue, columns=[a.name for a in arrs]),
+            value=_pval_matrix(pvalues, columns=[a.name for a in arrs]),
             type=StandardType.TABLE,
             title=f"Tukey HSD test result of {model.title}",
         )
@@ -145,14 +146,15 @@ def dunnett_test(win: SubWindow) -> Parametric:
                     break
             else:
                 raise ValueError(f"No group named {control!r}")
-        treatments = [dropna(a) for a in arrs]
-        control_arr = treatments.pop(idx)
-        columns = [a.name for a in arrs]
-        del columns[idx]
-        result = scikit_posthocs.posthoc_dunnett(control_arr, treatments)
+        # groups of a list input are labeled as 1, 2, ... in scikit-posthocs
+        result = cached_call(
+            scikit_posthocs.posthoc_dunnett,
+            [dropna(a) for a in arrs],
+            control=idx + 1,
+        )
         pvalues = result.to_numpy()
         return WidgetDataModel(
-            value=_pval_matrix(pvalues, columns=columns),
+            value=_pval_matrix(pvalues, columns=[a.name for a in arrs]),
             type=StandardType.TABLE,
             title=f"Dunnett's test result of {model.title}",
         )
@@ -163,14 +165,16 @@ def dunnett_test(win: SubWindow) -> Parametric:
 def _pval_matrix(pvalues: np.ndarray, columns: list[str]):
     size = pvalues.shape[0]
     pvalues_str = np.zeros((size + 1, size + 1), dtype=np.dtypes.StringDType())
-    for i in range(1, size + 1):
-        for j in range(1, size + 1):
-            if i > j:
-                pvalues_str[i, j] = pvalue_to_asterisks(pvalues[i - 1, j - 1])
-            elif i == j:
-                pvalues_str[i, j] = "1.0"
-            else:
-                pvalues_str[i, j] = format(pvalues[i - 1, j - 1], ".5g")
+    # lower triangle shows the asterisks and upper triangle shows the p-values
+    body = pvalues_str[1:, 1:]
+    lower = np.tril_indices(size, k=-1)
+    upper = np.triu_indices(size, k=1)
+    body[lower] = pvalue_to_asterisks_array(pvalues[lower])
+    # NaN means the pair was not tested (e.g. two treatments in Dunnett's test)
+    body[upper] = [
+        "" if np.isnan(p) else format(p, ".5g") for p in pvalues[upper].tolist()
+    ]
+    np.fill_diagonal(body, "1.0")
     pvalues_str[0, 1:] = columns
     pvalues_str[1:, 0] = columns
     return pvalues_str
@@ -9,7 +9,9 @@ from himena.qt.magicgui import SelectionEdit
 
 from himena_stats._lazy_import import stats
 from himena_stats.consts import MENUS_TEST
+from himena_stats.test_tools import _fast
 from himena_stats.test_tools._utils import (
+    cached_call,
     pvalue_to_asterisks,
     values_groups_to_xy,
     dropna,
@@ -46,7 +48,7 @@ def t_test(win: SubWindow) -> Parametric:
                 kind = "Student"
             else:
                 kind = "Welch"
-        t_result = stats.ttest_ind(
+        t_result = _fast.ttest_ind(
             dropna(x0), dropna(y0), equal_var=kind == "Student", alternative=alternative
         )
         return _ttest_result_to_model(
@@ -78,7 +80,7 @@ def paired_t_test(win: SubWindow) -> Parametric:
     ):
         model = win.to_model()
         x0, y0 = values_groups_to_xy(model, [a, b], groups)
-        t_result = stats.ttest_rel(dropna(x0), dropna(y0), alternative=alternative)
+        t_result = _fast.ttest_rel(dropna(x0), dropna(y0), alternative=alternative)
         return _ttest_result_to_model(
             t_result,
             title=f"Paired T-test result of {model.title}",
@@ -105,10 +107,33 @@ def wilcoxon_test(win: SubWindow) -> Parametric:
         b=None,
         groups=None,
         alternative: Literal["two-sided", "less", "greater"] = "two-sided",
+        method: Literal["auto", "exact", "approx"] = "auto",
     ):
+        """
+        Run Wilcoxon signed-rank test on a table-like data.
+
+        Parameters
+        ----------
+        method : str, default "auto"
+            The method to use to calculate the p-value. This parameter is forwarded to
+            `scipy.stats.wilcoxon`.
+
+            * 'auto' : uses 'exact' for small samples without ties or zeros, and
+                'approx' otherwise.
+            * 'exact' : uses the exact distribution of the test statistic. This is
+                accurate but slow for large samples.
+            * 'approx' : uses the normal approximation of the test statistic. This is
+                fast, and accurate enough for large samples.
+        """
         model = win.to_model()
         x0, y0 = values_groups_to_xy(model, [a, b], groups)
-        w_result = stats.wilcoxon(dropna(x0), dropna(y0), alternative=alternative)
+        w_result = cached_call(
+            stats.wilcoxon,
+            dropna(x0),
+            dropna(y0),
+            alternative=alternative,
+            method=method,
+        )
         w_result_table = [
             ["p-value", format(w_result.pvalue, ".5g")],
             ["", pvalue_to_asterisks(w_result.pvalue)],
@@ -143,7 +168,9 @@ def mann_whitney_u_test(win: SubWindow) -> Parametric:
     ):
         model = win.to_model()
         x0, y0 = values_groups_to_xy(model, [a, b], groups)
-        u_result = stats.mannwhitneyu(dropna(x0), dropna(y0), alternative=alternative)
+        u_result = cached_call(
+            _fast.mannwhitneyu, dropna(x0), dropna(y0), alternative=alternative
+        )
         u_result_table = [
             ["p-value", format(u_result.pvalue, ".5g")],
             ["", pvalue_to_asterisks(u_result.pvalue)],
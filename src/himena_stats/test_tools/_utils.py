@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Callable
 from himena import WidgetDataModel
-from himena.utils.collections import OrderedSet
 from himena.utils.table_selection import (
     model_to_col_val_arrays,
     model_to_vals_arrays,
@@ -15,17 +18,52 @@ def dropna(arr: NamedArray) -> np.ndarray:
     return arr.array[~mask]
 
 
+_PVALUE_THRESHOLDS = (0.0001, 0.001, 0.01, 0.05)
+_ASTERISKS = ("****", "***", "**", "*", "n.s.")
+
+
 def pvalue_to_asterisks(pval: float) -> str:
-    if pval > 0.05:
-        return "n.s."
-    elif pval > 0.01:
-        return "*"
-    elif pval > 0.001:
-        return "**"
-    elif pval > 0.0001:
-        return "***"
-    else:
-        return "****"
+    if np.isnan(pval):  # not tested
+        return ""
+    return _ASTERISKS[bisect_left(_PVALUE_THRESHOLDS, pval)]
+
+
+def pvalue_to_asterisks_array(pvals: np.ndarray) -> np.ndarray:
+    """Vectorized version of `pvalue_to_asterisks`."""
+    indices = np.searchsorted(_PVALUE_THRESHOLDS, pvals, side="left")
+    indices[np.isnan(pvals)] = len(_ASTERISKS)  # not tested
+    return np.array(_ASTERISKS + ("",), dtype=np.dtypes.StringDType())[indices]
+
+
+# NOTE: Test results are pure functions of the input arrays and options. Users often
+# re-run the same test with the same selection, so recent results are cached, keyed
+# by the digests of the array contents.
+_RESULT_CACHE: OrderedDict[tuple, Any] = OrderedDict()
+_RESULT_CACHE_SIZE = 64
+
+
+def _digest(arg) -> Any:
+    if isinstance(arg, np.ndarray):
+        arr = np.ascontiguousarray(arg)
+        h = blake2b(arr.tobytes(), digest_size=16)
+        h.update(f"{arr.dtype.str}{arr.shape}".encode())
+        return h.digest()
+    elif isinstance(arg, (list, tuple)):
+        return tuple(_digest(a) for a in arg)
+    return arg
+
+
+def cached_call(func: Callable, *args, **kwargs):
+    """Call `func(*args, **kwargs)`, reusing the result of the same input."""
+    key = (func, _digest(args), tuple(sorted(kwargs.items())))
+    if key in _RESULT_CACHE:
+        _RESULT_CACHE.move_to_end(key)
+        return _RESULT_CACHE[key]
+    out = func(*args, **kwargs)
+    _RESULT_CACHE[key] = out
+    if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+    return out
 
 
 def values_groups_to_arrays(
@@ -43,14 +81,43 @@ def values_groups_to_arrays(
         if len(values) != 1:
             raise ValueError("If groups are given, values must be a single range.")
         col, val = model_to_col_val_arrays(model, groups, values[0])
-        unique_values = OrderedSet(col.array)
-        arrs = [
-            NamedArray(str(uval), val.array[col.array == uval])
-            for uval in unique_values
-        ]
+        arrs = _groupby(col.array, val.array)
     return arrs
 
 
+_NAN = float("nan")  # dict lookup finds the same NaN object by identity
+
+
+def _groupby(labels: np.ndarray, values: np.ndarray) -> list[NamedArray]:
+    """Split `values` by `labels`, in the order of first appearance of each label."""
+    if labels.dtype.kind != "O":
+        return _groupby_sorted(labels, values)
+    # objects of mixed types (such as str and float NaN) cannot be sorted reliably
+    indices: dict[Any, list[int]] = {}
+    for i, label in enumerate(labels.tolist()):
+        if isinstance(label, float) and np.isnan(label):  # make NaNs one group
+            label = _NAN
+        indices.setdefault(label, []).append(i)
+    return [NamedArray(str(label), values[idx]) for label, idx in indices.items()]
+
+
+def _groupby_sorted(labels: np.ndarray, values: np.ndarray) -> list[NamedArray]:
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+    # unique labels are found from the boundaries of the sorted labels, which does
+    # not need another sort as `np.unique` does
+    is_new = np.empty(labels.size, dtype=np.bool_)
+    is_new[:1] = True
+    np.not_equal(sorted_labels[1:], sorted_labels[:-1], out=is_new[1:])
+    if labels.dtype.kind in "fc":  # NaNs are sorted to the end, make them one group
+        is_new[1:] &= ~np.isnan(sorted_labels[1:]) | ~np.isnan(sorted_labels[:-1])
+    first_idx = np.flatnonzero(is_new)
+    splits = np.split(values[order], first_idx[1:])
+    # stable sort keeps the first appearance at the head of each group
+    appearance = np.argsort(order[first_idx])
+    return [NamedArray(str(sorted_labels[first_idx[i]]), splits[i]) for i in appearance]
+
+
 def values_groups_to_xy(
     model: WidgetDataModel,
     values: list[tuple[tuple[int, int], tuple[int, int]] | None],
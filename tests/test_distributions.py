@@ -1,5 +1,12 @@
+import numpy as np
+from numpy.testing import assert_allclose
 import pytest
-from himena import MainWindow
+from scipy import stats
+from himena import MainWindow, StandardType, WidgetDataModel
+from himena_stats.distributions import _fast_pdf, _widget
+from himena_stats.distributions._fit import fit_dist
+from himena_stats.distributions._utils import draw_samples, infer_edges
+from himena_stats.distributions._widget import QDistributionView
 
 
 @pytest.mark.parametrize(
@@ -45,3 +52,151 @@ def test_construction_and_sampling(himena_ui: MainWindow, command: str, params:
         window_context=win_dist,
         with_params={"obs": win_sample.to_model(), "obs_range": None}
     )
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        stats.norm(loc=3.2, scale=4.5),
+        stats.uniform(loc=-2, scale=5.5),
+        stats.expon(scale=2.1),
+        stats.cauchy(loc=1.0, scale=2.0),
+        stats.gamma(a=3.0, scale=1.2),
+        stats.chi2(df=3, loc=0.5),
+        stats.beta(a=0.5, b=2.0, loc=-2, scale=10),
+        stats.t(df=1.5, loc=2, scale=3),
+        stats.binom(n=20, p=0.4),
+        stats.binom(n=20, p=1.0),
+        stats.poisson(mu=4.2),
+    ]
+)
+def test_fast_pdf_matches_scipy(dist):
+    if hasattr(dist, "pdf"):
+        x = np.linspace(-10, 20, 100)
+        assert_allclose(_fast_pdf.pdf(dist, x), dist.pdf(x), rtol=1e-10, atol=1e-12)
+    else:
+        x = np.arange(-3, 40)
+        assert_allclose(_fast_pdf.pmf(dist, x), dist.pmf(x), atol=1e-12)
+
+
+@pytest.mark.parametrize("name", ["norm", "uniform"])
+def test_closed_form_fit_matches_scipy(name: str):
+    obs = np.random.default_rng(0).normal(size=200)
+    fitted = fit_dist(obs, getattr(stats, name)())
+    assert_allclose(list(fitted.kwds.values()), getattr(stats, name).fit(obs))
+
+
+@pytest.mark.parametrize(
+    "dist,obs,fixed",
+    [
+        (stats.expon(), stats.expon(scale=2.0), {"floc": 0}),
+        (stats.gamma(a=1), stats.gamma(a=2.0, scale=1.5), {"floc": 0}),
+        (stats.beta(a=1, b=1), stats.beta(a=2.0, b=3.0), {"floc": 0, "fscale": 1}),
+    ],
+)
+def test_fit_with_fixed_loc_matches_scipy(dist, obs, fixed: dict):
+    obs = obs.rvs(size=200, random_state=0)
+    fitted = fit_dist(obs, dist)
+    *shapes, loc, scale = dist.dist.fit(obs, **fixed)
+    expected = dist.dist(*shapes, loc=loc, scale=scale)
+    assert_allclose(fitted.stats("mv"), expected.stats("mv"), rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "dist,obs",
+    [
+        (stats.gamma(a=1), np.append(stats.gamma(a=2.0).rvs(99, random_state=0), 0)),
+        (stats.beta(a=1, b=1), stats.beta(a=2.0, b=3.0).rvs(100, random_state=0) * 10),
+        (stats.expon(), stats.expon(loc=-5).rvs(200, random_state=0)),
+    ],
+)
+def test_fit_outside_support(dist, obs):
+    fitted = fit_dist(obs, dist)
+    assert np.isfinite(fitted.mean())
+
+
+def test_dist_view_grid_follows_width(qtbot, monkeypatch):
+    view = QDistributionView()
+    qtbot.addWidget(view)
+    graphics = view._img_view
+    edges_calls = []
+
+    def _infer_edges(dist):
+        edges_calls.append(dist)
+        return infer_edges(dist)
+
+    monkeypatch.setattr(_widget, "infer_edges", _infer_edges)
+
+    def num_vertices():
+        return graphics.scene().items()[0].polygon().size()
+
+    view.update_model(
+        WidgetDataModel(value=stats.norm(), type=StandardType.DISTRIBUTION)
+    )
+    assert num_vertices() == 102  # default before the view is laid out
+    view.resize(220, 200)
+    view.show()
+    qtbot.waitExposed(view)
+    qtbot.waitUntil(lambda: num_vertices() == graphics.viewport().width() + 2)
+    for width in range(300, 2000, 100):  # dragging the edge of the window
+        view.resize(width, 200)
+    qtbot.waitUntil(lambda: num_vertices() == 514)
+    assert len(edges_calls) == 1
+
+    view.update_model(
+        WidgetDataModel(value=stats.poisson(mu=3), type=StandardType.DISTRIBUTION)
+    )
+    assert all(key[1] is None for key in graphics._grid_cache if key[0][0] == "poisson")
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        stats.norm(loc=3.2, scale=4.5),
+        stats.uniform(loc=-2, scale=5.5),
+        stats.expon(loc=1, scale=2.1),
+        stats.cauchy(loc=1.0, scale=2.0),
+        stats.t(df=15, loc=2, scale=3),
+        stats.t(df=np.inf, loc=2, scale=3),
+        stats.gamma(a=3.0, scale=1.2),
+        stats.beta(a=0.5, b=2.0, loc=-2, scale=10),
+    ],
+)
+def test_draw_samples_continuous(dist):
+    samples = draw_samples(dist, 2000, random_state=0)
+    assert samples.shape == (2000,)
+    assert stats.kstest(samples, dist.cdf).pvalue > 0.001
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        stats.binom(n=20, p=0.4, loc=3),
+        stats.poisson(mu=4.2, loc=-1),
+    ],
+)
+def test_draw_samples_discrete(dist):
+    samples = draw_samples(dist, 20000, random_state=0)
+    assert samples.shape == (20000,)
+    assert_allclose([samples.mean(), samples.var()], dist.stats("mv"), rtol=0.05)
+
+
+@pytest.mark.parametrize(
+    "dist,edges",
+    [
+        (stats.uniform(loc=-2, scale=5.5), (-2, 3.5)),
+        (stats.beta(a=2.0, b=2.0, loc=1, scale=3), (1, 4)),
+        (stats.binom(n=10, p=0.3, loc=5), (5, 15)),
+        (stats.poisson(mu=3, loc=2), (2, stats.poisson(mu=3, loc=2).ppf(0.999))),
+    ],
+)
+def test_infer_edges(dist, edges):
+    assert_allclose(infer_edges(dist), edges)
+
+
+def test_dist_view_array_parameter(qtbot):
+    view = QDistributionView()
+    qtbot.addWidget(view)
+    dist = stats.norm(loc=np.array(1.0))
+    view.update_model(WidgetDataModel(value=dist, type=StandardType.DISTRIBUTION))
+    assert view._img_view.scene().items()[0].polygon().size() > 0
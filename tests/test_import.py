@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+
+def test_heavy_modules_not_imported_on_plugin_load():
+    # scipy and scikit-posthocs must be imported only when a function is called
+    code = (
+        "import sys\n"
+        "import himena_stats.distributions, himena_stats.io, himena_stats.test_tools\n"
+        "loaded = [m for m in ('scipy', 'scikit_posthocs') if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,5 +1,17 @@
+import numpy as np
+from numpy.testing import assert_allclose
 import pytest
+from scipy import stats
+import scikit_posthocs
 from himena import MainWindow, StandardType
+from himena_stats.test_tools import _fast
+from himena_stats.test_tools._multiple import _pval_matrix
+from himena_stats.test_tools._utils import (
+    _groupby,
+    cached_call,
+    pvalue_to_asterisks,
+    pvalue_to_asterisks_array,
+)
 
 table_data_sig = [
     ["a", "b"],
@@ -126,3 +138,158 @@ def test_a_vs_b_same_shape(himena_ui: MainWindow, command: str):
     )
     assert himena_ui.current_model.value[0, 0] == "p-value"
     assert float(himena_ui.current_model.value[0, 1]) > 0.3
+
+
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+def test_fast_ttest_matches_scipy(alternative):
+    rng = np.random.default_rng(0)
+    x = rng.normal(0, 1, size=12)
+    y = rng.normal(0.4, 2, size=9)
+    for equal_var in [True, False]:
+        res = _fast.ttest_ind(x, y, equal_var=equal_var, alternative=alternative)
+        ref = stats.ttest_ind(x, y, equal_var=equal_var, alternative=alternative)
+        assert_allclose(res, (ref.statistic, ref.pvalue, ref.df))
+    res = _fast.ttest_rel(x[:9], y, alternative=alternative)
+    ref = stats.ttest_rel(x[:9], y, alternative=alternative)
+    assert_allclose(res, (ref.statistic, ref.pvalue, ref.df))
+
+
+def test_fast_tukey_hsd_matches_scipy():
+    rng = np.random.default_rng(0)
+    samples = [rng.normal(i * 0.5, 1, size=8 + i) for i in range(4)]
+    assert_allclose(_fast.tukey_hsd(*samples), stats.tukey_hsd(*samples).pvalue)
+
+
+def test_cached_call():
+    calls = []
+
+    def func(x, ys, alternative="two-sided"):
+        calls.append(alternative)
+        return x.sum() + sum(y.sum() for y in ys)
+
+    x = np.arange(5.0)
+    ys = [np.ones(3), np.zeros(2)]
+    assert cached_call(func, x, ys) == 13
+    assert cached_call(func, x.copy(), [y.copy() for y in ys]) == 13
+    assert len(calls) == 1
+    cached_call(func, x, ys, alternative="less")
+    cached_call(func, x + 1, ys)
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+@pytest.mark.parametrize("ties", [False, True])
+def test_fast_mannwhitneyu_matches_scipy(alternative, ties):
+    rng = np.random.default_rng(0)
+    x = rng.normal(0, 3, size=15)
+    y = rng.normal(1, 3, size=12)
+    if ties:
+        x, y = np.round(x), np.round(y)
+    res = _fast.mannwhitneyu(x, y, alternative=alternative)
+    ref = stats.mannwhitneyu(x, y, alternative=alternative)
+    assert_allclose(res, (ref.statistic, ref.pvalue))
+
+
+@pytest.mark.parametrize("ties", [False, True])
+def test_fast_posthoc_dscf_matches_scikit_posthocs(ties):
+    rng = np.random.default_rng(0)
+    samples = [rng.normal(i * 0.5, 2, size=8 + i) for i in range(4)]
+    if ties:
+        samples = [np.round(s) for s in samples]
+    ref = scikit_posthocs.posthoc_dscf(samples).to_numpy()
+    assert_allclose(_fast.posthoc_dscf(samples), ref)
+
+
+@pytest.mark.parametrize("dtype", [None, np.dtypes.StringDType(), object])
+def test_groupby_first_appearance_order(dtype):
+    labels = np.array(["c", "a", "b", "a", "c", "c"], dtype=dtype)
+    groups = _groupby(labels, np.arange(6.0))
+    assert [g.name for g in groups] == ["c", "a", "b"]
+    assert [g.array.tolist() for g in groups] == [[0, 4, 5], [1, 3], [2]]
+
+
+@pytest.mark.parametrize("dtype", [np.float64, object])
+def test_groupby_merges_nan_labels(dtype):
+    labels = np.array([2.0, np.nan, 1.0, np.nan, 2.0, 1.0], dtype=dtype)
+    groups = _groupby(labels, np.arange(6.0))
+    assert [g.name for g in groups] == ["2.0", "nan", "1.0"]
+    assert [g.array.tolist() for g in groups] == [[0, 4], [1, 3], [2, 5]]
+
+
+def test_groupby_mixed_types():
+    labels = np.array(["b", 1, float("nan"), "b", 1, float("nan")], dtype=object)
+    groups = _groupby(labels, np.arange(6.0))
+    assert [g.name for g in groups] == ["b", "1", "nan"]
+    assert [g.array.tolist() for g in groups] == [[0, 3], [1, 4], [2, 5]]
+
+
+@pytest.mark.parametrize(
+    "pval,expected",
+    [
+        (0.0, "****"),
+        (1e-4, "****"),
+        (1.1e-4, "***"),
+        (1e-3, "***"),
+        (0.01, "**"),
+        (0.05, "*"),
+        (0.0501, "n.s."),
+        (1.0, "n.s."),
+        (np.nan, ""),
+    ],
+)
+def test_pvalue_to_asterisks(pval, expected):
+    assert pvalue_to_asterisks(pval) == expected
+    assert pvalue_to_asterisks_array(np.array([pval]))[0] == expected
+
+
+def test_pval_matrix():
+    pvalues = np.array(
+        [
+            [1.0, 0.05, 1e-4],
+            [0.05, 1.0, np.nan],
+            [1e-4, np.nan, 1.0],
+        ]
+    )
+    columns = ["group-with-a-very-long-name", "b", "c"]
+    out = _pval_matrix(pvalues, columns)
+    assert out.tolist() == [
+        ["", "group-with-a-very-long-name", "b", "c"],
+        ["group-with-a-very-long-name", "1.0", "0.05", "0.0001"],
+        ["b", "*", "1.0", ""],
+        ["c", "****", "", "1.0"],
+    ]
+
+
+table_data_multi = [
+    ["a", "b", "c"],
+    [1.0, 2.0, 3.1],
+    [1.2, 2.5, 3.3],
+    [0.9, 2.1, 2.9],
+    [1.1, 2.2, 3.5],
+    [1.3, 2.4, 3.0],
+]
+
+
+@pytest.mark.parametrize(
+    "command,params",
+    [
+        ("steel-dwass", {}),
+        ("tukey-hsd", {}),
+        ("dunnett", {"control": "b"}),
+    ],
+)
+def test_multi_comparison(himena_ui: MainWindow, command: str, params: dict):
+    win = himena_ui.add_object(table_data_multi, type=StandardType.TABLE)
+    values = [((0, 100), (i, i + 1)) for i in range(3)]
+    himena_ui.exec_action(
+        f"himena-stats:test-multi:{command}",
+        window_context=win,
+        with_params={"values": values, "groups": None, **params},
+    )
+    out = himena_ui.current_model.value
+    assert out[0, 1:].tolist() == ["a", "b", "c"]
+    assert out[1:, 0].tolist() == ["a", "b", "c"]
+    assert float(out[1, 2]) < 0.05  # a vs b
+    assert float(out[2, 3]) < 0.05  # b vs c
+    if command == "dunnett":  # a vs c is not tested
+        assert out[1, 3] == out[3, 1] == ""